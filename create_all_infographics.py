@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+OmniBazaar Infographic Batch Runner
+Renders every infographic generator in parallel, one worker process per
+script, so a full regeneration takes roughly as long as the slowest
+single infographic instead of the sum of all of them.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import subprocess
+import sys
+import os
+
+SCRIPTS = [
+    "create_infographic.py",
+    "create_features_infographic.py",
+    "create_fees_infographic.py",
+    "create_infographic_3.py",
+    "create_lp_rewards_infographic.py",
+    "create_rewards_infographic.py",
+    "generate_lp_infographic.py",
+]
+
+
+def run_script(name):
+    """Render one infographic in a child process; return (name, rc, output)."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+    proc = subprocess.run([sys.executable, path],
+                          capture_output=True, text=True)
+    return name, proc.returncode, (proc.stdout + proc.stderr).strip()
+
+
+def main():
+    failures = 0
+    with ProcessPoolExecutor(max_workers=min(len(SCRIPTS),
+                                             os.cpu_count() or 1)) as pool:
+        futures = [pool.submit(run_script, name) for name in SCRIPTS]
+        for fut in as_completed(futures):
+            name, rc, output = fut.result()
+            status = "ok" if rc == 0 else f"FAILED (exit {rc})"
+            print(f"{name}: {status}")
+            if output:
+                print(f"  {output.replace(chr(10), chr(10) + '  ')}")
+            failures += rc != 0
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
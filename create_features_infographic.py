@@ -6,11 +6,17 @@ Style matches OmniBazaar_Yield_Infographic.png
 """
 
 from PIL import Image, ImageDraw, ImageFont
+import functools
 import os
 
+try:
+    import numpy as np
+except ImportError:  # gradients fall back to Image.linear_gradient
+    np = None
+
 # Configuration
 WIDTH = 1200
-HEIGHT = 3200  # will be cropped to content
+HEIGHT = 3043  # exact content height of the fixed layout; bump when adding sections
 BACKGROUND_COLOR = "#0f1419"
 PRIMARY_COLOR = "#00d4aa"
 SECONDARY_COLOR = "#1da1f2"
@@ -25,70 +31,211 @@ OUTPUT_PATH = "/home/omnirick/OmniBazaar/OmniBazaar_Infographic.png"
 GLOBE_PATH = "/home/omnirick/OmniBazaar/UI Mockup/OmniBazaar Globe-clear-256x256.png"
 
 
+@functools.lru_cache(maxsize=None)
 def hex_to_rgb(hex_color):
     hex_color = hex_color.lstrip('#')
     return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
 
 
-def draw_rounded_rect(draw, coords, radius, fill):
-    x1, y1, x2, y2 = coords
-    r = min(radius, (x2 - x1) // 2, (y2 - y1) // 2)
-    draw.rectangle([x1 + r, y1, x2 - r, y2], fill=fill)
-    draw.rectangle([x1, y1 + r, x2, y2 - r], fill=fill)
-    draw.ellipse([x1, y1, x1 + 2 * r, y1 + 2 * r], fill=fill)
-    draw.ellipse([x2 - 2 * r, y1, x2, y1 + 2 * r], fill=fill)
-    draw.ellipse([x1, y2 - 2 * r, x1 + 2 * r, y2], fill=fill)
-    draw.ellipse([x2 - 2 * r, y2 - 2 * r, x2, y2], fill=fill)
+@functools.lru_cache(maxsize=None)
+def load_font(path, size):
+    """Load a truetype font once per (path, size)."""
+    return ImageFont.truetype(path, size)
 
 
-def draw_gradient_rect(img, coords, color_top, color_bot, radius=0):
-    """Draw a rectangle with a vertical gradient fill."""
+@functools.lru_cache(maxsize=None)
+def text_width(text, font):
+    """Measure rendered text width once per (text, font)."""
+    bbox = font.getbbox(text)
+    return bbox[2] - bbox[0]
+
+
+@functools.lru_cache(maxsize=None)
+def rounded_rect_mask(w, h, radius):
+    """Build an alpha mask for a rounded rectangle, cached per (w, h, radius).
+
+    Cards, accent bars and pills reuse a handful of shapes, so each unique
+    mask is rasterized only once instead of on every call.
+    """
+    # Pillow box coordinates are inclusive, so the shape spans w+1 x h+1
+    mask = Image.new('L', (w + 1, h + 1), 0)
+    md = ImageDraw.Draw(mask)
+    r = min(radius, w // 2, h // 2)
+    md.rectangle([r, 0, w - r, h], fill=255)
+    md.rectangle([0, r, w, h - r], fill=255)
+    md.ellipse([0, 0, 2 * r, 2 * r], fill=255)
+    md.ellipse([w - 2 * r, 0, w, 2 * r], fill=255)
+    md.ellipse([0, h - 2 * r, 2 * r, h], fill=255)
+    md.ellipse([w - 2 * r, h - 2 * r, w, h], fill=255)
+    return mask
+
+
+def draw_rounded_rect(draw, coords, radius, fill):
     x1, y1, x2, y2 = coords
-    ct = hex_to_rgb(color_top)
-    cb = hex_to_rgb(color_bot)
-    h = y2 - y1
-    overlay = Image.new('RGBA', (x2 - x1, h), (0, 0, 0, 0))
-    od = ImageDraw.Draw(overlay)
-    for row in range(h):
-        t = row / max(h - 1, 1)
-        r = int(ct[0] + (cb[0] - ct[0]) * t)
-        g = int(ct[1] + (cb[1] - ct[1]) * t)
-        b = int(ct[2] + (cb[2] - ct[2]) * t)
-        od.line([(0, row), (x2 - x1, row)], fill=(r, g, b, 255))
+    draw.bitmap((x1, y1), rounded_rect_mask(x2 - x1, y2 - y1, radius),
+                fill=fill)
+
+
+@functools.lru_cache(maxsize=None)
+def gradient_overlay(w, h, ct, cb, radius):
+    """Pre-rendered gradient card prototype, cached per unique spec.
+
+    Sections reuse the same card size and colors, so repeated cards cost
+    one paste each instead of a full re-render.
+    """
+    if np is not None:
+        # Interpolate all rows at once instead of stamping h draw.line
+        # calls, using 8.8 fixed-point integer math throughout
+        t = (np.arange(h, dtype=np.int32) * 255
+             // max(h - 1, 1))[:, None]
+        rgb = ((np.array(ct, dtype=np.int32) * (255 - t)
+                + np.array(cb, dtype=np.int32) * t) // 255).astype(np.uint8)
+        arr = np.broadcast_to(rgb[:, None, :], (h, w, 3)).copy()
+        alpha = np.full((h, w, 1), 255, np.uint8)
+        overlay = Image.fromarray(np.concatenate([arr, alpha], axis=2),
+                                  'RGBA')
+    else:
+        # Pure-Pillow path: blend two solid fills through a resized
+        # built-in vertical gradient mask
+        grad = Image.linear_gradient('L').resize((w, h))
+        top = Image.new('RGBA', (w, h), ct + (255,))
+        bot = Image.new('RGBA', (w, h), cb + (255,))
+        overlay = Image.composite(bot, top, grad)
     if radius > 0:
         mask = Image.new('L', overlay.size, 0)
         md = ImageDraw.Draw(mask)
         draw_rounded_rect(md, (0, 0, overlay.width, overlay.height),
                           radius, 255)
         overlay.putalpha(mask)
+    return overlay
+
+
+def draw_gradient_rect(img, coords, color_top, color_bot, radius=0):
+    """Draw a rectangle with a vertical gradient fill."""
+    x1, y1, x2, y2 = coords
+    overlay = gradient_overlay(x2 - x1, y2 - y1, hex_to_rgb(color_top),
+                               hex_to_rgb(color_bot), radius)
     img.paste(overlay, (x1, y1), overlay)
 
 
-def draw_hr(draw, y, margin=80):
-    draw.rectangle((margin, y, WIDTH - margin, y + 1),
-                   fill=hex_to_rgb(MUTED_COLOR))
+@functools.lru_cache(maxsize=None)
+def text_block_tile(text, font, fill, spacing):
+    """Rasterize a multiline text block once onto a transparent tile.
+
+    Repeated bullet blocks (same text, font and color) are then plain
+    alpha blits instead of fresh glyph rasterization.
+    """
+    probe = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+    bbox = probe.multiline_textbbox((0, 0), text, font=font,
+                                    spacing=spacing)
+    tile = Image.new('RGBA', (int(bbox[2]) + 1, int(bbox[3]) + 1),
+                     (0, 0, 0, 0))
+    ImageDraw.Draw(tile).multiline_text((0, 0), text, font=font,
+                                        fill=fill, spacing=spacing)
+    return tile
+
+
+def draw_bullet_list(img, xy, lines, font, fill, step, prefix="• "):
+    """Blit a bullet list from a cached pre-rendered tile.
+
+    Pillow advances multiline text by getbbox("A") height + spacing, so
+    the spacing is derived from the requested per-line step to keep the
+    same layout as the old one-draw-call-per-line loops.
+    """
+    line_height = font.getbbox("A")[3]
+    tile = text_block_tile("\n".join(prefix + ln for ln in lines),
+                           font, fill, step - line_height)
+    img.paste(tile, xy, tile)
+
+
+def draw_centered_lines(draw, cx, ty, lines, font, fill, step):
+    """Render centered lines with one multiline_text call.
+
+    Matches the old per-line anchor="mm" loops: the first line's vertical
+    midpoint sits at ty and each further line advances by step. The "ma"
+    anchor pins the ascender, so ty is shifted up by half the font's
+    ascent + descent to land the midpoint in the same place.
+    """
+    ascent, descent = font.getmetrics()
+    line_height = font.getbbox("A")[3]
+    draw.multiline_text((cx, ty - (ascent + descent) / 2),
+                        "\n".join(lines), font=font, fill=fill,
+                        anchor="ma", align="center",
+                        spacing=step - line_height)
+
+
+@functools.lru_cache(maxsize=None)
+def load_globe(size):
+    """Load the globe logo at the given size.
+
+    Prefers a pre-resized sidecar asset (written on first use) so later
+    runs skip the 256px decode + LANCZOS resize entirely.
+    """
+    root, ext = os.path.splitext(GLOBE_PATH)
+    resized_path = f"{root}-{size}x{size}{ext}"
+    if os.path.exists(resized_path):
+        return Image.open(resized_path).convert('RGBA')
+    globe = Image.open(GLOBE_PATH).convert('RGBA')
+    globe = globe.resize((size, size), Image.Resampling.LANCZOS)
+    try:
+        globe.save(resized_path)
+    except OSError:
+        pass  # asset dir may be read-only; just resize again next run
+    return globe
+
+
+@functools.lru_cache(maxsize=None)
+def hr_line(w):
+    """Solid rule image, built once per width and pasted thereafter."""
+    return Image.new('RGB', (w, 2), hex_to_rgb(MUTED_COLOR))
+
+
+def draw_hr(img, y, margin=80):
+    img.paste(hr_line(WIDTH - 2 * margin + 1), (margin, y))
+
+
+def save_png(img, path):
+    """Flatten and write the final PNG.
+
+    Uses pyvips' threaded, streaming encoder when it is installed —
+    worthwhile as the infographic grows to several megapixels — and
+    falls back to Pillow's encoder otherwise.
+    """
+    rgb = img.convert('RGB')
+    try:
+        import pyvips
+    except ImportError:
+        rgb.save(path, "PNG", optimize=True, compress_level=6)
+        return
+    vimg = pyvips.Image.new_from_memory(rgb.tobytes(), rgb.width,
+                                        rgb.height, 3, 'uchar')
+    vimg.pngsave(path, compression=6)
 
 
 def create_infographic():
-    img = Image.new('RGB', (WIDTH, HEIGHT), hex_to_rgb(BACKGROUND_COLOR))
-    draw = ImageDraw.Draw(img)
+    # RGBA canvas so alpha-masked pastes composite without per-paste
+    # mode conversions; flattened to RGB once at save time
+    img = Image.new('RGBA', (WIDTH, HEIGHT), hex_to_rgb(BACKGROUND_COLOR))
+    # Single draw handle for the whole render, with the blend mode
+    # pinned explicitly rather than inferred per call
+    draw = ImageDraw.Draw(img, 'RGBA')
 
     # Fonts
     try:
         B = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
         R = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
-        f_title = ImageFont.truetype(B, 52)
-        f_brand = ImageFont.truetype(B, 56)
-        f_sect = ImageFont.truetype(B, 36)
-        f_lg = ImageFont.truetype(B, 30)
-        f_mb = ImageFont.truetype(B, 24)
-        f_m = ImageFont.truetype(R, 24)
-        f_n = ImageFont.truetype(R, 20)
-        f_sb = ImageFont.truetype(B, 18)
-        f_s = ImageFont.truetype(R, 18)
-        f_tb = ImageFont.truetype(B, 15)
-        f_t = ImageFont.truetype(R, 15)
-        f_apy = ImageFont.truetype(B, 40)
+        f_title = load_font(B, 52)
+        f_brand = load_font(B, 56)
+        f_sect = load_font(B, 36)
+        f_lg = load_font(B, 30)
+        f_mb = load_font(B, 24)
+        f_m = load_font(R, 24)
+        f_n = load_font(R, 20)
+        f_sb = load_font(B, 18)
+        f_s = load_font(R, 18)
+        f_tb = load_font(B, 15)
+        f_t = load_font(R, 15)
+        f_apy = load_font(B, 40)
     except Exception:
         f_title = f_brand = f_sect = f_lg = f_mb = f_m = ImageFont.load_default()
         f_n = f_sb = f_s = f_tb = f_t = f_apy = f_title
@@ -97,11 +244,9 @@ def create_infographic():
 
     # ── LOGO: Globe + "OmniBazaar" ────────────────────────────
     try:
-        globe = Image.open(GLOBE_PATH).convert('RGBA')
-        globe = globe.resize((90, 90), Image.Resampling.LANCZOS)
+        globe = load_globe(90)
         # Composite globe + text: center them together
-        brand_bbox = draw.textbbox((0, 0), "OmniBazaar", font=f_brand)
-        brand_w = brand_bbox[2] - brand_bbox[0]
+        brand_w = text_width("OmniBazaar", f_brand)
         total_w = 90 + 16 + brand_w
         gx = (WIDTH - total_w) // 2
         img.paste(globe, (gx, y), globe)
@@ -164,23 +309,18 @@ def create_infographic():
         draw_rounded_rect(draw, (cx, y, cx + cw, y + 5), 3,
                           hex_to_rgb(color))
         lines = title.split('\n')
-        ty = y + 22
-        for ln in lines:
-            draw.text((cx + cw // 2, ty), ln, font=f_sb,
-                      fill=hex_to_rgb(color), anchor="mm")
-            ty += 20
-        ty += 8
-        for ln in desc.split('\n'):
-            draw.text((cx + cw // 2, ty), ln, font=f_t,
-                      fill=hex_to_rgb(TEXT_COLOR), anchor="mm")
-            ty += 19
+        draw_centered_lines(draw, cx + cw // 2, y + 22, lines, f_sb,
+                            hex_to_rgb(color), step=20)
+        ty = y + 22 + 20 * len(lines) + 8
+        draw_centered_lines(draw, cx + cw // 2, ty, desc.split('\n'),
+                            f_t, hex_to_rgb(TEXT_COLOR), step=19)
         # Sector volume at bottom
         draw.text((cx + cw // 2, y + ch - 16), volume, font=f_tb,
                   fill=hex_to_rgb(color), anchor="mm")
     y += ch + 25
 
     # ── DIFFERENTIATORS ───────────────────────────────────────
-    draw_hr(draw, y)
+    draw_hr(img, y)
     y += 34
     draw.text((WIDTH // 2, y), "WHY OMNIBAZAAR IS DIFFERENT", font=f_sect,
               fill=hex_to_rgb(TEXT_COLOR), anchor="mm")
@@ -216,20 +356,15 @@ def create_infographic():
         draw_rounded_rect(draw, (cx, y, cx + dw, y + dh), 12,
                           hex_to_rgb(CARD_COLOR))
         lines = title.split('\n')
-        ty = y + 22
-        for ln in lines:
-            draw.text((cx + dw // 2, ty), ln, font=f_sb,
-                      fill=hex_to_rgb(color), anchor="mm")
-            ty += 22
-        ty += 10
-        for b in bullets:
-            draw.text((cx + 18, ty), f"\u2022 {b}", font=f_t,
-                      fill=hex_to_rgb(TEXT_COLOR))
-            ty += 22
+        draw_centered_lines(draw, cx + dw // 2, y + 22, lines, f_sb,
+                            hex_to_rgb(color), step=22)
+        ty = y + 22 + 22 * len(lines) + 10
+        draw_bullet_list(img, (cx + 18, ty), bullets, f_t,
+                         hex_to_rgb(TEXT_COLOR), step=22)
     y += dh + 25
 
     # ── TRUSTLESS ARCHITECTURE ────────────────────────────────
-    draw_hr(draw, y)
+    draw_hr(img, y)
     y += 34
     draw.text((WIDTH // 2, y), "TRUSTLESS HYBRID ARCHITECTURE",
               font=f_sect, fill=hex_to_rgb(TEXT_COLOR), anchor="mm")
@@ -253,11 +388,8 @@ def create_infographic():
         "MEV commit-reveal protection",
         "Circuit breaker emergency stop",
     ]
-    ty = y + 48
-    for it in items_on:
-        draw.text((lx + 20, ty), f"\u2713 {it}", font=f_t,
-                  fill=hex_to_rgb(TEXT_COLOR))
-        ty += 26
+    draw_bullet_list(img, (lx + 20, y + 48), items_on, f_t,
+                     hex_to_rgb(TEXT_COLOR), step=26, prefix="\u2713 ")
 
     # Off-chain
     rx = lx + hw + 30
@@ -274,15 +406,12 @@ def create_infographic():
         "Participation scoring",
         "Search engine & indexing",
     ]
-    ty = y + 48
-    for it in items_off:
-        draw.text((rx + 20, ty), f"\u2713 {it}", font=f_t,
-                  fill=hex_to_rgb(TEXT_COLOR))
-        ty += 26
+    draw_bullet_list(img, (rx + 20, y + 48), items_off, f_t,
+                     hex_to_rgb(TEXT_COLOR), step=26, prefix="\u2713 ")
     y += bh + 25
 
     # ── WALLET ────────────────────────────────────────────────
-    draw_hr(draw, y)
+    draw_hr(img, y)
     y += 34
     draw.text((WIDTH // 2, y), "OMNIWALLET: 128 CHAINS, ONE WALLET",
               font=f_sect, fill=hex_to_rgb(TEXT_COLOR), anchor="mm")
@@ -309,16 +438,11 @@ def create_infographic():
         draw_rounded_rect(draw, (cx, y, cx + wcw, y + wch), 10,
                           hex_to_rgb(CARD_COLOR))
         lines = title.split('\n')
-        ty = y + 18
-        for ln in lines:
-            draw.text((cx + wcw // 2, ty), ln, font=f_sb,
-                      fill=hex_to_rgb(color), anchor="mm")
-            ty += 20
-        ty += 6
-        for ln in desc.split('\n'):
-            draw.text((cx + wcw // 2, ty), ln, font=f_t,
-                      fill=hex_to_rgb(TEXT_COLOR), anchor="mm")
-            ty += 19
+        draw_centered_lines(draw, cx + wcw // 2, y + 18, lines, f_sb,
+                            hex_to_rgb(color), step=20)
+        ty = y + 18 + 20 * len(lines) + 6
+        draw_centered_lines(draw, cx + wcw // 2, ty, desc.split('\n'),
+                            f_t, hex_to_rgb(TEXT_COLOR), step=19)
     y += wch + 8
 
     draw.text(
@@ -330,7 +454,7 @@ def create_infographic():
     y += 35
 
     # ── EARNING OPPORTUNITIES ─────────────────────────────────
-    draw_hr(draw, y)
+    draw_hr(img, y)
     y += 34
     draw.text((WIDTH // 2, y), "EARNING OPPORTUNITIES", font=f_sect,
               fill=hex_to_rgb(TEXT_COLOR), anchor="mm")
@@ -368,12 +492,13 @@ def create_infographic():
           "Early = highest APY"],
          ACCENT_PURPLE),
     ]
-    for i, (title, sub, apy, bullets, color) in enumerate(liq_cards):
+    # Paste all gradient card backgrounds first, then draw text on top
+    for i in range(len(liq_cards)):
         cx = 50 + i * (liq_w + 12)
-        # Gradient-tinted card
         draw_gradient_rect(img, (cx, y, cx + liq_w, y + liq_h),
                            CARD_HIGHLIGHT, CARD_COLOR, radius=12)
-        draw = ImageDraw.Draw(img)  # refresh draw after paste
+    for i, (title, sub, apy, bullets, color) in enumerate(liq_cards):
+        cx = 50 + i * (liq_w + 12)
         # Color accent bar at top
         draw_rounded_rect(draw, (cx, y, cx + liq_w, y + 5), 3,
                           hex_to_rgb(color))
@@ -386,11 +511,8 @@ def create_infographic():
         draw.text((cx + liq_w // 2, y + 78), apy + " APY", font=f_lg,
                   fill=hex_to_rgb(TEXT_COLOR), anchor="mm")
         # Bullets
-        ty = y + 106
-        for b in bullets:
-            draw.text((cx + 16, ty), f"\u2022 {b}", font=f_t,
-                      fill=hex_to_rgb(TEXT_COLOR))
-            ty += 21
+        draw_bullet_list(img, (cx + 16, y + 106), bullets, f_t,
+                         hex_to_rgb(TEXT_COLOR), step=21)
     y += liq_h + 22
 
     # ── Staking Rewards table ─────────────────────────────────
@@ -447,25 +569,23 @@ def create_infographic():
     ]
     ecw = (WIDTH - 80 - 48) // 5
     ech = 105
+    # Background pass, then text pass (see liquidity cards above)
     for i, (title, desc, icon, color) in enumerate(earn_cards):
         cx = 40 + i * (ecw + 12)
-        # Gradient card
         draw_gradient_rect(img, (cx, y, cx + ecw, y + ech),
                            color, CARD_COLOR, radius=10)
-        draw = ImageDraw.Draw(img)
+    for i, (title, desc, icon, color) in enumerate(earn_cards):
+        cx = 40 + i * (ecw + 12)
         # Title with icon
         draw.text((cx + ecw // 2, y + 20), title, font=f_sb,
                   fill=hex_to_rgb(TEXT_COLOR), anchor="mm")
         # Description lines
-        ty = y + 42
-        for ln in desc.split('\n'):
-            draw.text((cx + ecw // 2, ty), ln, font=f_t,
-                      fill=hex_to_rgb(TEXT_COLOR), anchor="mm")
-            ty += 19
+        draw_centered_lines(draw, cx + ecw // 2, y + 42, desc.split('\n'),
+                            f_t, hex_to_rgb(TEXT_COLOR), step=19)
     y += ech + 25
 
     # ── COMING SOON ───────────────────────────────────────────
-    draw_hr(draw, y)
+    draw_hr(img, y)
     y += 34
     draw.text((WIDTH // 2, y), "COMING SOON", font=f_sect,
               fill=hex_to_rgb(TEXT_COLOR), anchor="mm")
@@ -504,20 +624,15 @@ def create_infographic():
         draw_rounded_rect(draw, (cx, y, cx + sw2, y + sh2), 12,
                           hex_to_rgb(CARD_COLOR))
         lines = title.split('\n')
-        ty = y + 22
-        for ln in lines:
-            draw.text((cx + sw2 // 2, ty), ln, font=f_sb,
-                      fill=hex_to_rgb(color), anchor="mm")
-            ty += 22
-        ty += 8
-        for b in bullets:
-            draw.text((cx + 18, ty), f"\u2022 {b}", font=f_t,
-                      fill=hex_to_rgb(TEXT_COLOR))
-            ty += 24
+        draw_centered_lines(draw, cx + sw2 // 2, y + 22, lines, f_sb,
+                            hex_to_rgb(color), step=22)
+        ty = y + 22 + 22 * len(lines) + 8
+        draw_bullet_list(img, (cx + 18, ty), bullets, f_t,
+                         hex_to_rgb(TEXT_COLOR), step=24)
     y += sh2 + 25
 
     # ── TOKENOMICS ────────────────────────────────────────────
-    draw_hr(draw, y)
+    draw_hr(img, y)
     y += 34
     draw.text((WIDTH // 2, y), "TOKENOMICS SNAPSHOT", font=f_sect,
               fill=hex_to_rgb(TEXT_COLOR), anchor="mm")
@@ -552,7 +667,6 @@ def create_infographic():
     # ── CTA ───────────────────────────────────────────────────
     draw_gradient_rect(img, (200, y, WIDTH - 200, y + 55),
                        PRIMARY_COLOR, "#009977", radius=28)
-    draw = ImageDraw.Draw(img)
     draw.text((WIDTH // 2, y + 27),
               "OMNIBAZAAR: THERE'S A MARKET FOR EVERYTHING", font=f_mb,
               fill=hex_to_rgb(BACKGROUND_COLOR), anchor="mm")
@@ -571,10 +685,13 @@ def create_infographic():
 
     # ── CROP ──────────────────────────────────────────────────
     final_h = y + 10
-    if final_h < HEIGHT:
+    if final_h > HEIGHT:
+        print(f"WARNING: content height {final_h} exceeds canvas "
+              f"{HEIGHT}; increase HEIGHT")
+    elif final_h < HEIGHT:
         img = img.crop((0, 0, WIDTH, final_h))
 
-    img.save(OUTPUT_PATH, "PNG", quality=95)
+    save_png(img, OUTPUT_PATH)
     print(f"Saved: {OUTPUT_PATH}")
     print(f"Size: {WIDTH} x {final_h}")
 